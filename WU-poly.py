@@ -8,13 +8,13 @@ MIT License
 """
 
 import sys
-import time
 import polyinterface
 from nodes import WUController
 
 LOGGER = polyinterface.LOGGER
 
-if __name__ == "__main__":
+def main():
+    """Start the node server and run until interrupted."""
     try:
         LOGGER.info('Starting Weather Underground Node Server')
         polyglot = polyinterface.Interface('WeatherUnderground')
@@ -28,5 +28,9 @@ if __name__ == "__main__":
         sys.exit(0)
     
     except Exception as err:
-        LOGGER.error('Caught exception: {0}\n'.format(err), exc_info=True)
-        sys.exit(1) 
\ No newline at end of file
+        LOGGER.error('Caught exception: %s\n', err, exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 """Weather Underground Node Server Controller."""
+import asyncio
+import threading
 import polyinterface
 from nodes.WUNode import WUNode
 
@@ -19,6 +21,9 @@ class WUController(polyinterface.Controller):
         self.api_key = None
         self.location = None
         self.configured = False
+        self.loop = None
+        self._short_pollers = []
+        self._long_pollers = []
         
         # Define custom parameters
         self.params = {
@@ -58,6 +63,7 @@ class WUController(polyinterface.Controller):
         """Start the controller."""
         try:
             LOGGER.info('Starting Weather Underground Controller')
+            self._start_loop()
             self.check_config()
             if not self.configured:
                 LOGGER.error('Configuration not complete')
@@ -66,26 +72,56 @@ class WUController(polyinterface.Controller):
             self.discover()
             self.setDriver('ST', 1)
         except Exception as err:
-            LOGGER.error(f'Error starting controller: {err}')
+            LOGGER.error('Error starting controller: %s', err)
             self.setDriver('ST', 0)
 
+    def _start_loop(self):
+        """Start the background event loop shared by the nodes."""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    async def _gather(self, coros):
+        """Run node poll coroutines concurrently and log any failures."""
+        for result in await asyncio.gather(*coros, return_exceptions=True):
+            if isinstance(result, Exception):
+                LOGGER.error('Error polling node: %s', result)
+
     def shortPoll(self):
         """Poll for quick-changing data."""
+        if not self.configured:
+            return
         try:
-            for node in self.nodes.values():
-                if hasattr(node, 'shortPoll') and node.address != self.address:
-                    node.shortPoll()
+            coros = [node.shortPoll_async() for node in self._short_pollers]
+            asyncio.run_coroutine_threadsafe(self._gather(coros), self.loop).result()
         except Exception as err:
-            LOGGER.error(f'Error in shortPoll: {err}')
+            LOGGER.error('Error in shortPoll: %s', err)
 
     def longPoll(self):
         """Poll for slow-changing data."""
+        if not self.configured:
+            return
         try:
-            for node in self.nodes.values():
-                if hasattr(node, 'longPoll') and node.address != self.address:
-                    node.longPoll()
+            coros = [node.longPoll_async() for node in self._long_pollers]
+            asyncio.run_coroutine_threadsafe(self._gather(coros), self.loop).result()
         except Exception as err:
-            LOGGER.error(f'Error in longPoll: {err}')
+            LOGGER.error('Error in longPoll: %s', err)
+
+    def addNode(self, node, update=False):
+        """Add a node and register its poll coroutines."""
+        result = super().addNode(node, update)
+        if node.address != self.address:
+            if hasattr(node, 'shortPoll_async'):
+                self._short_pollers.append(node)
+            if hasattr(node, 'longPoll_async'):
+                self._long_pollers.append(node)
+        return result
+
+    def delNode(self, address):
+        """Delete a node and unregister its poll coroutines."""
+        self._short_pollers = [n for n in self._short_pollers if n.address != address]
+        self._long_pollers = [n for n in self._long_pollers if n.address != address]
+        return super().delNode(address)
 
     def query(self, command=None):
         """Query all nodes."""
@@ -95,7 +131,7 @@ class WUController(polyinterface.Controller):
                 if node.address != self.address:
                     node.reportDrivers()
         except Exception as err:
-            LOGGER.error(f'Error querying nodes: {err}')
+            LOGGER.error('Error querying nodes: %s', err)
 
     def discover(self, *args, **kwargs):
         """Discover nodes - required by ISY."""
@@ -116,7 +152,7 @@ class WUController(polyinterface.Controller):
                 ))
                 self.setDriver('ST', 1)
         except Exception as err:
-            LOGGER.error(f'Error discovering nodes: {err}')
+            LOGGER.error('Error discovering nodes: %s', err)
             self.setDriver('ST', 0)
 
     def delete(self):
@@ -124,7 +160,7 @@ class WUController(polyinterface.Controller):
         try:
             self.stop()
         except Exception as err:
-            LOGGER.error(f'Error deleting node server: {err}')
+            LOGGER.error('Error deleting node server: %s', err)
 
     def stop(self):
         """Stop the node server."""
@@ -133,9 +169,12 @@ class WUController(polyinterface.Controller):
             for node in self.nodes.values():
                 if hasattr(node, 'stop') and node.address != self.address:
                     node.stop()
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self.loop = None
             self.poly.stop()
         except Exception as err:
-            LOGGER.error(f'Error stopping node server: {err}')
+            LOGGER.error('Error stopping node server: %s', err)
 
     def check_config(self):
         """Verify required configuration items are set."""
@@ -143,29 +182,26 @@ class WUController(polyinterface.Controller):
             self.removeNoticesAll()
             
             # Get the configuration parameters
-            self.api_key = self.polyConfig.get('api_key')
-            self.location = self.polyConfig.get('location')
+            cfg = self.polyConfig
+            self.api_key = cfg.get('api_key')
+            self.location = cfg.get('location')
             
-            # Check if parameters are set and valid
+            # Check that each parameter is set and not left at its default
             self.configured = True
-            
-            # Check API key
-            if not self.api_key or self.api_key == self.params['api_key']['default']:
-                self.configured = False
-                LOGGER.error('Missing or invalid API key')
-                self.addNotice({'key': 'api_key', 'value': 'Please enter your Weather API key'})
-                
-            # Check location
-            if not self.location or self.location == self.params['location']['default']:
-                self.configured = False
-                LOGGER.error('Missing or invalid location')
-                self.addNotice({'key': 'location', 'value': 'Please enter a valid location'})
+            for param, label, value, message in (
+                ('api_key', 'API key', self.api_key, 'Please enter your Weather API key'),
+                ('location', 'location', self.location, 'Please enter a valid location')
+            ):
+                if not value or value == self.params[param]['default']:
+                    self.configured = False
+                    LOGGER.error('Missing or invalid %s', label)
+                    self.addNotice({'key': param, 'value': message})
                 
             # Set status based on configuration
             self.setDriver('ST', 1 if self.configured else 0)
                 
         except Exception as err:
-            LOGGER.error(f'Error checking configuration: {err}')
+            LOGGER.error('Error checking configuration: %s', err)
             self.configured = False
             self.setDriver('ST', 0)
 
@@ -174,11 +210,11 @@ class WUController(polyinterface.Controller):
         try:
             self.removeNoticesAll()
         except Exception as err:
-            LOGGER.error(f'Error removing notices: {err}')
+            LOGGER.error('Error removing notices: %s', err)
 
     def update_profile(self, command=None):
         """Update the profile files on ISY."""
         try:
             self.poly.updateProfile()
         except Exception as err:
-            LOGGER.error(f'Error updating profile: {err}') 
\ No newline at end of file
+            LOGGER.error('Error updating profile: %s', err) 
\ No newline at end of file
@@ -1,10 +1,19 @@
 """Node class for Weather Underground data."""
+import asyncio
+import random
+import threading
 import time
-import requests
+import aiohttp
+from collections import deque
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import polyinterface
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 LOGGER = polyinterface.LOGGER
 
 class WUNode(polyinterface.Node):
@@ -13,13 +22,18 @@ class WUNode(polyinterface.Node):
     id = 'weather'
     hint = 0x01020800
     
-    WEATHER_API_BASE = 'https://api.weatherapi.com/v1/current.json'
     FORECAST_API_BASE = 'https://api.weatherapi.com/v1/forecast.json'
     DEFAULT_TIMEOUT = 10
+    KEEPALIVE_TIMEOUT = 360
     MAX_RETRIES = 3
-    RETRY_DELAY = 5
+    MAX_RETRY_DELAY = 30
     RATE_LIMIT_CALLS = 10
     RATE_LIMIT_PERIOD = 60
+    FRESH_TTL = timedelta(minutes=5)
+    STALE_TTL = timedelta(minutes=30)
+    MAX_TTL = timedelta(minutes=40)
+    MAX_FAILURES = 3
+    FAILURE_COOLDOWN = 300
     
     drivers = [
         {'driver': 'ST', 'value': 0, 'uom': 17},     # Temperature (F)
@@ -33,72 +47,159 @@ class WUNode(polyinterface.Node):
         {'driver': 'GV1', 'value': 0, 'uom': 25},     # Condition Text
     ]
 
+    # (driver, (source, *keys), cast, default) where source is 'current'
+    # or 'day' (the first forecast day)
+    _DRIVER_MAP = (
+        ('ST', ('current', 'temp_f'), float, 0),
+        ('CLITEMP', ('current', 'temp_f'), float, 0),
+        ('CLIHUM', ('current', 'humidity'), int, 0),
+        ('BARPRES', ('current', 'pressure_in'), float, 0),
+        ('WINDDIR', ('current', 'wind_degree'), int, 0),
+        ('WINDSPD', ('current', 'wind_mph'), float, 0),
+        ('RAINRT', ('current', 'precip_in'), float, 0),
+        ('GV0', ('day', 'daily_chance_of_rain'), int, 0),
+        ('GV1', ('current', 'condition', 'text'), str, 'Unknown'),
+    )
+
     def __init__(self, controller, primary, address, name, api_key=None, location=None):
         """Initialize the weather node."""
         super().__init__(controller, primary, address, name)
         self.api_key = api_key
         self.location = location
+        self._formatted_location = self._format_location()
+        self._params = {
+            'key': api_key,
+            'q': self._formatted_location,
+            'days': 1,
+            'aqi': 'no'
+        }
         self._last_api_call = datetime.min
-        self._api_calls = []
+        self._api_calls = deque()
         self._last_update = datetime.min
         self._cached_data = {}
+        self._last_epoch = None
+        self._no_change_streak = 0
+        self._effective_ttl = self.FRESH_TTL
+        self._responses: Dict[str, dict] = {}
+        self._etag: Dict[str, str] = {}
+        self._last_modified: Dict[str, str] = {}
+        self._last_values: Dict[str, Any] = {}
+        self._session = None
+        self._refresh_task = None
+        self._update_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._cooldown_until = 0.0
         self.commands = {'QUERY': self.query}
 
     def start(self):
         """Start the node."""
         try:
-            self.update_weather()
+            self._run(self.update_weather())
         except Exception as err:
-            LOGGER.error(f'Error starting node: {err}')
-            self.setDriver('ST', 0)
+            LOGGER.error('Error starting node: %s', err)
+            self._set_if_changed('ST', 0)
 
     def stop(self):
         """Stop the node."""
         try:
             LOGGER.info('Stopping weather node')
-            self.setDriver('ST', 0)
+            self._set_if_changed('ST', 0)
+            if self._session is not None:
+                self._run(self._session.close())
+                self._session = None
         except Exception as err:
-            LOGGER.error(f'Error stopping node: {err}')
-        
+            LOGGER.error('Error stopping node: %s', err)
+
+    def _run(self, coro):
+        """Run a coroutine on the controller's event loop and wait for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.controller.loop).result()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating it on the event loop if needed."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=4,
+                    limit_per_host=2,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.DEFAULT_TIMEOUT)
+            )
+        return self._session
+
     def query(self, command=None):
         """Query the node's status."""
         try:
             self.reportDrivers()
         except Exception as err:
-            LOGGER.error(f'Error querying node: {err}')
+            LOGGER.error('Error querying node: %s', err)
 
     def shortPoll(self):
         """Poll for frequent updates."""
         try:
-            if self._cached_data and datetime.now() - self._last_update < timedelta(minutes=5):
-                return
-            self.update_weather()
+            self._run(self.shortPoll_async())
         except Exception as err:
-            LOGGER.error(f'Error in shortPoll: {err}')
+            LOGGER.error('Error in shortPoll: %s', err)
 
     def longPoll(self):
         """Poll for infrequent updates."""
         try:
-            self.update_weather()
+            self._run(self.longPoll_async())
         except Exception as err:
-            LOGGER.error(f'Error in longPoll: {err}')
+            LOGGER.error('Error in longPoll: %s', err)
+
+    async def shortPoll_async(self):
+        """Poll for frequent updates on the controller's event loop.
 
-    def _check_rate_limit(self):
+        Fresh cached data is left as is. The fresh window grows while the
+        upstream data stays unchanged, see _track_changes, and the stale
+        window moves with it. Stale cached data stays on the drivers while
+        a refresh runs in the background, and a failed refresh leaves it
+        there. Only expired or missing data waits on the API.
+        """
+        try:
+            if self._in_cooldown():
+                return
+            age = datetime.now() - self._last_update
+            if self._cached_data and age < self._effective_ttl:
+                return
+            if self._cache_usable():
+                self._refresh_task = asyncio.ensure_future(self.update_weather())
+                return
+            await self.update_weather()
+        except Exception as err:
+            LOGGER.error('Error in shortPoll: %s', err)
+
+    async def longPoll_async(self):
+        """Poll for infrequent updates on the controller's event loop.
+
+        Cached data within the current fresh window is left as is, so the
+        backoff in _track_changes also applies to long polls.
+        """
+        try:
+            if self._in_cooldown():
+                return
+            if self._cached_data and datetime.now() - self._last_update < self._effective_ttl:
+                return
+            await self.update_weather()
+        except Exception as err:
+            LOGGER.error('Error in longPoll: %s', err)
+
+    async def _check_rate_limit(self):
         """Implement rate limiting for API calls."""
         try:
-            now = datetime.now()
-            self._api_calls = [t for t in self._api_calls 
-                              if now - t < timedelta(seconds=self.RATE_LIMIT_PERIOD)]
+            now = time.monotonic()
+            while self._api_calls and now - self._api_calls[0] >= self.RATE_LIMIT_PERIOD:
+                self._api_calls.popleft()
             
             if len(self._api_calls) >= self.RATE_LIMIT_CALLS:
-                sleep_time = (self._api_calls[0] + 
-                             timedelta(seconds=self.RATE_LIMIT_PERIOD) - now).total_seconds()
+                sleep_time = self._api_calls[0] + self.RATE_LIMIT_PERIOD - now
                 if sleep_time > 0:
-                    LOGGER.info(f'Rate limit reached, waiting {sleep_time:.1f} seconds')
-                    time.sleep(sleep_time)
+                    LOGGER.info('Rate limit reached, waiting %.1f seconds', sleep_time)
+                    await asyncio.sleep(sleep_time)
             self._api_calls.append(now)
         except Exception as err:
-            LOGGER.error(f'Error in rate limiting: {err}')
+            LOGGER.error('Error in rate limiting: %s', err)
 
     def _format_location(self) -> str:
         """Convert location to required format for API."""
@@ -111,52 +212,87 @@ class WUNode(polyinterface.Node):
             return self.location
         return self.location.replace(' ', '_')
 
-    def update_weather(self) -> bool:
+    async def update_weather(self) -> bool:
         """Update weather data from API."""
-        if not self.api_key or not self.location:
-            LOGGER.error('Missing API key or location')
-            self.setDriver('ST', 0)
+        if not self._update_lock.acquire(blocking=False):
+            LOGGER.debug('update_weather already in flight')
             return False
 
         try:
-            self._check_rate_limit()
-            current_params = {
-                'key': self.api_key,
-                'q': self._format_location(),
-                'aqi': 'no'
-            }
-            
-            current_data = self._make_api_request(
-                self.WEATHER_API_BASE, 
-                current_params
-            )
-            if not current_data:
-                self.setDriver('ST', 0)
+            if not self.api_key or not self.location:
+                LOGGER.error('Missing API key or location')
+                self._set_if_changed('ST', 0)
                 return False
 
-            forecast_params = {**current_params, 'days': 1}
-            forecast_data = self._make_api_request(
-                self.FORECAST_API_BASE,
-                forecast_params
-            )
+            try:
+                await self._check_rate_limit()
+                # The forecast endpoint also returns current conditions
+                data = await self._make_api_request(self.FORECAST_API_BASE, self._params)
+                if not data:
+                    self._record_failure()
+                    if not self._cache_usable():
+                        self._set_if_changed('ST', 0)
+                    return False
 
-            weather_data = {
-                'current': current_data.get('current', {}),
-                'forecast': forecast_data.get('forecast', {})
-            }
+                weather_data = {
+                    'current': data.get('current', {}),
+                    'forecast': data.get('forecast', {})
+                }
 
-            self._cached_data = weather_data
-            self._last_update = datetime.now()
-            self._update_drivers(weather_data)
-            return True
+                self._consecutive_failures = 0
+                self._track_changes(weather_data['current'].get('last_updated_epoch'))
+                self._cached_data = weather_data
+                self._last_update = datetime.now()
+                self._update_drivers(weather_data)
+                return True
 
-        except Exception as e:
-            LOGGER.error(f'Failed to update weather: {str(e)}')
-            self.setDriver('ST', 0)
-            return False
+            except Exception as e:
+                LOGGER.error('Failed to update weather: %s', e)
+                self._record_failure()
+                if not self._cache_usable():
+                    self._set_if_changed('ST', 0)
+                return False
+        finally:
+            self._update_lock.release()
+
+    def _cache_usable(self) -> bool:
+        """Return True while cached data is inside the stale window."""
+        stale_window = self._effective_ttl + self.STALE_TTL - self.FRESH_TTL
+        return bool(self._cached_data) and datetime.now() - self._last_update < stale_window
+
+    def _record_failure(self) -> None:
+        """Count a failed update and start a cooldown after too many in a row."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.MAX_FAILURES:
+            LOGGER.warning('%d consecutive update failures, pausing polls for %d seconds',
+                           self._consecutive_failures, self.FAILURE_COOLDOWN)
+            self._cooldown_until = time.monotonic() + self.FAILURE_COOLDOWN
+
+    def _in_cooldown(self) -> bool:
+        """Return True while polls are paused after repeated failures."""
+        return time.monotonic() < self._cooldown_until
 
-    def _make_api_request(self, url: str, params: dict) -> Optional[dict]:
+    def _track_changes(self, epoch: Optional[int]) -> None:
+        """Back off the fresh window while upstream data is unchanged.
+        
+        Args:
+            epoch: last_updated_epoch of the current conditions
+        """
+        if epoch is not None and epoch == self._last_epoch:
+            self._no_change_streak += 1
+            self._effective_ttl = min(self._effective_ttl * 2, self.MAX_TTL)
+            LOGGER.debug('Weather unchanged for %d updates, refreshing every %s',
+                         self._no_change_streak, self._effective_ttl)
+        else:
+            self._no_change_streak = 0
+            self._effective_ttl = self.FRESH_TTL
+        self._last_epoch = epoch
+
+    async def _make_api_request(self, url: str, params: dict) -> Optional[dict]:
         """Make API request with retries.
+
+        Validators from the last good response for the URL are sent along
+        so an unchanged payload comes back as 304 and is served from cache.
         
         Args:
             url: API endpoint URL
@@ -165,26 +301,63 @@ class WUNode(polyinterface.Node):
         Returns:
             Optional[dict]: API response data or None if request fails
         """
+        headers = {}
+        if url in self._etag:
+            headers['If-None-Match'] = self._etag[url]
+        if url in self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified[url]
+
         for attempt in range(self.MAX_RETRIES):
+            retry_after = None
             try:
-                response = requests.get(
-                    url,
-                    params=params,
-                    timeout=self.DEFAULT_TIMEOUT
-                )
-                response.raise_for_status()
-                data = response.json()
+                async with self._get_session().get(url, params=params, headers=headers) as response:
+                    if response.status == 304 and url in self._responses:
+                        return self._responses[url]
+                    if response.status == 429:
+                        retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    response.raise_for_status()
+                    data = json_loads(await response.read())
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
                 if 'error' in data:
-                    LOGGER.error(f"API Error: {data['error']['message']}")
+                    LOGGER.error('API Error: %s', data['error']['message'])
                     return None
+                self._responses[url] = data
+                if etag:
+                    self._etag[url] = etag
+                if last_modified:
+                    self._last_modified[url] = last_modified
                 return data
-            except requests.exceptions.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
                 if attempt == self.MAX_RETRIES - 1:
-                    LOGGER.error(f'API request failed after {self.MAX_RETRIES} attempts: {e}')
+                    LOGGER.error('API request failed after %d attempts: %s', self.MAX_RETRIES, e)
+                    return None
+                if retry_after is None:
+                    delay = min(2 ** attempt + random.uniform(0, 1), self.MAX_RETRY_DELAY)
+                elif retry_after > self.MAX_RETRY_DELAY:
+                    LOGGER.warning('API asked to retry after %.0f seconds, skipping this update',
+                                   retry_after)
                     return None
-                time.sleep(self.RETRY_DELAY)
+                else:
+                    delay = retry_after
+                await asyncio.sleep(delay)
         return None
 
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds.
+        
+        Args:
+            value: Retry-After header value
+            
+        Returns:
+            Optional[float]: Seconds to wait, or None if missing or not numeric
+        """
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            return None
+
     def _update_drivers(self, data: dict) -> None:
         """Update node drivers with weather data.
         
@@ -192,21 +365,30 @@ class WUNode(polyinterface.Node):
             data: Weather data from API
         """
         try:
-            current = data.get('current', {})
             forecast = data.get('forecast', {}).get('forecastday', [{}])[0]
+            sources = {
+                'current': data.get('current', {}),
+                'day': forecast.get('day', {})
+            }
 
-            self.setDriver('ST', float(current.get('temp_f', 0)))
-            self.setDriver('CLITEMP', float(current.get('temp_f', 0)))
-            self.setDriver('CLIHUM', int(current.get('humidity', 0)))
-            self.setDriver('BARPRES', float(current.get('pressure_in', 0)))
-            self.setDriver('WINDDIR', int(current.get('wind_degree', 0)))
-            self.setDriver('WINDSPD', float(current.get('wind_mph', 0)))
-            self.setDriver('RAINRT', float(current.get('precip_in', 0)))
-
-            day = forecast.get('day', {})
-            self.setDriver('GV0', int(day.get('daily_chance_of_rain', 0)))
-            self.setDriver('GV1', str(current.get('condition', {}).get('text', 'Unknown')))
+            for driver, (source, *keys), cast, default in self._DRIVER_MAP:
+                value = sources[source]
+                for key in keys[:-1]:
+                    value = value.get(key, {})
+                self._set_if_changed(driver, cast(value.get(keys[-1], default)))
 
         except (ValueError, TypeError, KeyError) as e:
-            LOGGER.error(f'Error updating drivers: {e}')
-            self.setDriver('ST', 0) 
\ No newline at end of file
+            LOGGER.error('Error updating drivers: %s', e)
+            self._set_if_changed('ST', 0) 
+
+    def _set_if_changed(self, driver: str, value: Any) -> None:
+        """Set a driver only when its value differs from the last one sent.
+        
+        Args:
+            driver: Driver name
+            value: New driver value
+        """
+        if self._last_values.get(driver) == value:
+            return
+        self.setDriver(driver, value)
+        self._last_values[driver] = value